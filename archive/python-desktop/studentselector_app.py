@@ -1,4 +1,7 @@
+import random
 import tkinter as tk
+import tkinter.font as tkfont
+from concurrent.futures import ThreadPoolExecutor
 
 import ttkbootstrap as ttk
 from ttkbootstrap import Style
@@ -8,8 +11,21 @@ from studentselector_app_main import AppMainMixin
 from studentselector_app_session import AppSessionMixin
 from studentselector_app_style import AppStyleMixin
 from studentselector_app_window import AppWindowMixin
-from studentselector_config import MESSAGES_CSV, PALETTE, STUDENTS_CSV
-from studentselector_services import SoundManager, load_messages_by_rating, load_students_by_class
+from studentselector_config import (
+    MESSAGES_CSV,
+    PALETTE,
+    RATING_SOUNDS,
+    RNG_SEED,
+    SLOT_SOUND_SHORT,
+    STUDENTS_CSV,
+    TIMEUP_SOUND,
+)
+from studentselector_services import (
+    SoundManager,
+    cached_load,
+    load_messages_by_rating,
+    load_students_by_class,
+)
 
 
 class InvisibleHandApp(
@@ -22,8 +38,28 @@ class InvisibleHandApp(
     def __init__(self, root: tk.Tk, style: Style):
         self.root = root
         self.style = style
-        self.sound = SoundManager()
+        # Read both CSVs on worker threads while fonts and theme are set up
+        # below; State collects the results (re-raising any load error).
+        loader = ThreadPoolExecutor(max_workers=2)
+        classes_future = loader.submit(cached_load, STUDENTS_CSV, load_students_by_class)
+        messages_future = loader.submit(cached_load, MESSAGES_CSV, load_messages_by_rating)
+        loader.shutdown(wait=False)
+        # Only the short cues that must land on a click are decoded up front.
+        # Intro/closing and the medium/long slot loops would hold minutes of
+        # raw PCM for the whole session; they stream through mixer.music.
+        self.sound = SoundManager(
+            preload=(
+                *RATING_SOUNDS.values(),
+                TIMEUP_SOUND,
+                SLOT_SOUND_SHORT,
+            )
+        )
         self.palette = dict(PALETTE)
+        # One generator for all picks so a session can be replayed via SELECTOR_SEED.
+        self._rng = random.Random(RNG_SEED)
+        self._fit_cache: dict[tuple, tkfont.Font] = {}
+        self._font_cache: dict[tuple, tkfont.Font] = {}
+        self._measure_fonts: dict[tuple[str, str], tkfont.Font] = {}
 
         # Typography / classroom projection
         self.FONT_FAMILY = self._pick_font_family("Aptos", "Segoe UI", "Arial")
@@ -53,8 +89,10 @@ class InvisibleHandApp(
         self._apply_visual_theme()
 
         # State
-        self.classes = load_students_by_class(STUDENTS_CSV)
-        self.messages = load_messages_by_rating(MESSAGES_CSV)
+        self.classes = classes_future.result()
+        self.messages = messages_future.result()
+        self._message_bags: dict[str, list[str]] = {}
+        self._class_values = ["Select a Class"] + sorted(self.classes)
 
         self.selected_class = ttk.StringVar(value="Select a Class")
         self.time_preset_var = tk.IntVar(value=5)
@@ -73,12 +111,14 @@ class InvisibleHandApp(
         self.student_grades: dict[str, str] = {}
         self.student_ungraded: list[str] = []
         self.absent_students: list[str] = []
+        self._formatted_names: dict[str, str] = {}
         self.exit_requested = False
 
         # Window placement and behavior
         self._configure_root_window()
 
         # UI
+        self._main_frame: tk.Frame | None = None
         self._build_main_screen()
 
     def _remember_selected_student(self, class_name: str, student_name: str) -> None:
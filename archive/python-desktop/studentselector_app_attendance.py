@@ -16,7 +16,7 @@ class AppAttendanceMixin:
             return
 
         class_name = selected
-        roster = list(self.classes.get(class_name, []))
+        roster = self.classes.get(class_name, ())
 
         win = ttk.Toplevel(self.root)
         win.title(f"{class_name} - Attendance")
@@ -80,8 +80,7 @@ class AppAttendanceMixin:
 
         btns = tk.Frame(outer, bg=p["bg"])
         btns.pack(fill="x", pady=(self.fs(8), 0))
-        btns.grid_columnconfigure(0, weight=1)
-        btns.grid_columnconfigure(1, weight=1)
+        btns.grid_columnconfigure((0, 1), weight=1)
 
         def save():
             absent = [n for n, v in vars_by_student.items() if v.get()]
@@ -127,7 +126,7 @@ class AppAttendanceMixin:
             return
 
         class_name = selected
-        roster = list(self.classes.get(class_name, []))
+        roster = self.classes.get(class_name, ())
         if not roster:
             Messagebox.show_info(title="No Students", message="This class has no students in the roster.")
             return
@@ -291,8 +290,7 @@ class AppAttendanceMixin:
 
         btn_frame = tk.Frame(win, bg=p["bg"])
         btn_frame.pack(fill="x", padx=self.fs(24), pady=(self.fs(16), self.fs(24)))
-        btn_frame.grid_columnconfigure(0, weight=1)
-        btn_frame.grid_columnconfigure(1, weight=1)
+        btn_frame.grid_columnconfigure((0, 1), weight=1)
 
         def _update_display():
             nonlocal idx
@@ -330,7 +328,7 @@ class AppAttendanceMixin:
 
             # Rebuild the session roster from the master class list minus absentees
             # and students already chosen during this app run.
-            master = list(self.classes.get(class_name, []))
+            master = self.classes.get(class_name, ())
             chosen = set(self._chosen_students_for_class(class_name))
             self.session_students_by_class[class_name] = [
                 s for s in master if s not in absent and s not in chosen
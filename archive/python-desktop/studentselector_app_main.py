@@ -15,11 +15,44 @@ class AppMainMixin:
         _ = self.slot_effect_enabled_var.get()
 
     def _build_main_screen(self):
-        self._clear_root()
-        p = self.palette
+        """
+        Show the control dock. Widgets are created once; later calls only
+        refresh the parts that depend on session state. Returning to the
+        dock still closes every other window (slot, popup, summary, dialogs).
+        """
+        for w in self.root.winfo_children():
+            if w is not self._main_frame:
+                w.destroy()
+        if self._main_frame is None or not self._main_frame.winfo_exists():
+            self._create_main_screen()
+        self._refresh_main_screen()
+
+    def _refresh_main_screen(self):
         selected_class = self._active_or_selected_class()
         metrics = self._class_metrics(selected_class)
         has_class = selected_class in self.classes
+
+        self._main_summary_label.config(
+            text=(
+                self._format_metrics_summary(metrics)
+                if has_class
+                else "Select a class to start"
+            )
+        )
+        self._main_roster_label.config(
+            text=(
+                f"{metrics['remaining']} left of {metrics['roster_total']}"
+                if has_class
+                else "No class selected"
+            )
+        )
+
+        preset = self.time_preset_var.get()
+        for seconds, btn in self._main_preset_buttons:
+            btn.configure(style="TimeOn.TButton" if seconds == preset else "TimeOff.TButton")
+
+    def _create_main_screen(self):
+        p = self.palette
         _, window_h = self._root_window_size()
 
         if window_h <= 900:
@@ -43,6 +76,7 @@ class AppMainMixin:
 
         content = tk.Frame(self.root, bg=p["bg"], padx=outer_pad, pady=outer_pad)
         content.pack(fill="both", expand=True)
+        self._main_frame = content
         content.grid_columnconfigure(0, weight=1)
 
         header = tk.Frame(content, bg=p["bg"])
@@ -55,18 +89,15 @@ class AppMainMixin:
             fg=p["text_light"],
             anchor="w",
         ).pack(anchor="w")
-        tk.Label(
+        self._main_summary_label = tk.Label(
             header,
-            text=(
-                self._format_metrics_summary(metrics)
-                if has_class
-                else "Select a class to start"
-            ),
+            text="",
             font=self.f(11 if compact else 12),
             bg=p["bg"],
             fg=p["text_muted"],
             anchor="w",
-        ).pack(anchor="w", pady=(d(2), 0))
+        )
+        self._main_summary_label.pack(anchor="w", pady=(d(2), 0))
 
         panel = tk.Frame(content, bg=p["panel"], padx=panel_pad, pady=panel_pad)
         panel.grid(row=1, column=0, sticky="ew")
@@ -86,24 +117,20 @@ class AppMainMixin:
             state="readonly",
             font=self.f(20),
             style="Dock.TCombobox",
-            values=["Select a Class"] + sorted(self.classes.keys()),
+            values=self._class_values,
         )
         class_dropdown.grid(row=1, column=0, sticky="ew", pady=(d(4), d(4)))
         class_dropdown.bind("<<ComboboxSelected>>", lambda e: self._on_class_selected())
 
-        roster_note = (
-            f"{metrics['remaining']} left of {metrics['roster_total']}"
-            if has_class
-            else "No class selected"
-        )
-        tk.Label(
+        self._main_roster_label = tk.Label(
             panel,
-            text=roster_note,
+            text="",
             font=self.f(11 if compact else 12),
             bg=p["panel"],
             fg=p["text_muted"],
             anchor="w",
-        ).grid(row=2, column=0, sticky="w", pady=(0, d(8)))
+        )
+        self._main_roster_label.grid(row=2, column=0, sticky="w", pady=(0, d(8)))
 
         tk.Label(
             panel,
@@ -115,8 +142,7 @@ class AppMainMixin:
         ).grid(row=3, column=0, sticky="w")
         tf = tk.Frame(panel, bg=p["panel"])
         tf.grid(row=4, column=0, sticky="ew", pady=(d(4), d(8)))
-        for col in range(4):
-            tf.grid_columnconfigure(col, weight=1, uniform="preset")
+        tf.grid_columnconfigure((0, 1, 2, 3), weight=1, uniform="preset")
 
         presets = [("5 sec", 5), ("30 sec", 30), ("1 min", 60), ("2 min", 120)]
 
@@ -124,19 +150,20 @@ class AppMainMixin:
             self.time_preset_var.set(seconds)
             self._build_main_screen()
 
+        self._main_preset_buttons = []
         for i, (label, seconds) in enumerate(presets):
             btn = ttk.Button(
                 tf,
                 text=label,
-                style="TimeOn.TButton" if seconds == self.time_preset_var.get() else "TimeOff.TButton",
+                style="TimeOff.TButton",
                 command=lambda s=seconds: _set_preset(s),
             )
             btn.grid(row=0, column=i, sticky="ew", padx=(0 if i == 0 else button_gap, 0), ipady=d(4))
+            self._main_preset_buttons.append((seconds, btn))
 
         toggles = tk.Frame(panel, bg=p["panel"])
         toggles.grid(row=5, column=0, sticky="ew", pady=(0, d(8)))
-        toggles.grid_columnconfigure(0, weight=1, uniform="toggle")
-        toggles.grid_columnconfigure(1, weight=1, uniform="toggle")
+        toggles.grid_columnconfigure((0, 1), weight=1, uniform="toggle")
 
         def toggle_tile(col: int, title: str, variable, command):
             tile = tk.Frame(
@@ -176,8 +203,7 @@ class AppMainMixin:
         controls.grid(row=6, column=0, sticky="ew", pady=(0, d(8)))
         # Use two columns so labels can display fully: top row for attendance/summary,
         # bottom row for sound controls.
-        for col in range(2):
-            controls.grid_columnconfigure(col, weight=1, uniform="ctrl")
+        controls.grid_columnconfigure((0, 1), weight=1, uniform="ctrl")
         # First row: attendance and summary
         ttk.Button(
             controls,
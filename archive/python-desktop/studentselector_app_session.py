@@ -1,4 +1,6 @@
-import random
+import bisect
+import functools
+import math
 import time
 import tkinter as tk
 import tkinter.font as tkfont
@@ -7,6 +9,7 @@ import ttkbootstrap as ttk
 from ttkbootstrap.dialogs import Messagebox
 
 from studentselector_config import (
+    LOW_POWER_REEL,
     MEDIUM_MAX,
     RATING_SOUNDS,
     SHORT_MAX,
@@ -17,6 +20,22 @@ from studentselector_config import (
     WINDOW_WIDTH,
 )
 
+# Slot loop by duration: <= SHORT_MAX, <= MEDIUM_MAX, otherwise long.
+_SLOT_SOUND_THRESHOLDS = (SHORT_MAX, MEDIUM_MAX)
+_SLOT_SOUNDS = (SLOT_SOUND_SHORT, SLOT_SOUND_MEDIUM, SLOT_SOUND_LONG)
+
+# Reel speed in rows/sec, eased from max to min over the countdown. The curve
+# is sampled once at import so each frame looks up its target speed instead of
+# evaluating pow().
+_REEL_MAX_ROWS_PER_SEC = 7.5
+_REEL_MIN_ROWS_PER_SEC = 1.0
+_REEL_SPEED_STEPS = 1023
+_REEL_SPEED_CURVE = tuple(
+    _REEL_MIN_ROWS_PER_SEC
+    + (_REEL_MAX_ROWS_PER_SEC - _REEL_MIN_ROWS_PER_SEC) * ((1.0 - i / _REEL_SPEED_STEPS) ** 2.1)
+    for i in range(_REEL_SPEED_STEPS + 1)
+)
+
 
 class AppSessionMixin:
     def _get_duration_seconds(self) -> float:
@@ -28,11 +47,36 @@ class AppSessionMixin:
         return float(total)
 
     def _slot_sound_for_duration(self, duration: float) -> str:
-        if duration <= SHORT_MAX:
-            return SLOT_SOUND_SHORT
-        if duration <= MEDIUM_MAX:
-            return SLOT_SOUND_MEDIUM
-        return SLOT_SOUND_LONG
+        return _SLOT_SOUNDS[bisect.bisect_left(_SLOT_SOUND_THRESHOLDS, duration)]
+
+    def _take_session_student(self, student_name: str, idx_hint: int | None = None) -> None:
+        """
+        Swap-pop a picked student out of the live roster (order is not shown).
+        The index from _next_student skips the scan unless the list changed.
+        """
+        students = self.session_students
+        if idx_hint is None or not (0 <= idx_hint < len(students)) or students[idx_hint] != student_name:
+            try:
+                idx_hint = students.index(student_name)
+            except ValueError:
+                return
+        last = students.pop()
+        if idx_hint < len(students):
+            students[idx_hint] = last
+
+    def _next_rating_message(self, rating: str) -> str:
+        """
+        Deals feedback from a shuffled bag per rating, so every message for a
+        rating is shown once before any repeats. Refills when the bag empties.
+        """
+        bag = self._message_bags.get(rating)
+        if not bag:
+            bag = list(self.messages.get(rating) or ())
+            if not bag:
+                return "Noted."
+            self._rng.shuffle(bag)
+            self._message_bags[rating] = bag
+        return bag.pop()
 
     def _start_session(self):
         self.exit_requested = False
@@ -50,11 +94,15 @@ class AppSessionMixin:
         if class_name not in self.absent_students_by_class:
             self.absent_students_by_class[class_name] = []
 
-        master_roster = list(self.classes.get(class_name, []))
+        master_roster = self.classes.get(class_name, ())
         if not master_roster:
             Messagebox.show_error(title="Error", message=f"No students found for {class_name}.")
             return
 
+        # Reel labels are derived from names only; format the roster once here
+        # instead of on every reel rotation.
+        self._formatted_names = {name: self._format_reel_name(name) for name in master_roster}
+
         # Initialize (or reinitialize) from the master class list, excluding
         # students already chosen during this app run and students marked absent.
         roster = self._effective_session_roster(class_name)
@@ -86,10 +134,11 @@ class AppSessionMixin:
             self._show_grades_summary()
             return
 
-        final_student = random.choice(self.session_students)
+        final_idx = self._rng.randrange(len(self.session_students))
         self._show_slot_window(
             class_name,
-            final_student,
+            self.session_students[final_idx],
+            final_idx=final_idx,
             anchor_rect=anchor_rect,
             anchor_work_area=anchor_work_area,
         )
@@ -98,6 +147,7 @@ class AppSessionMixin:
         self,
         class_name: str,
         final_student: str,
+        final_idx: int | None = None,
         anchor_rect: tuple[int, int, int, int] | None = None,
         anchor_work_area: tuple[int, int, int, int] | None = None,
     ):
@@ -115,7 +165,7 @@ class AppSessionMixin:
             self._slot_window_geometry(
                 parent_w=WINDOW_WIDTH,
                 anchor_rect=anchor_rect,
-                anchor_work_area=anchor_work_area,
+                anchor_work_area=target_work_area,
             )
         )
         _, _, work_w, work_h = target_work_area
@@ -210,7 +260,7 @@ class AppSessionMixin:
 
         def _round_rect(x1, y1, x2, y2, r, **kwargs):
             r = max(2, int(r))
-            points = [
+            points = (
                 x1 + r, y1,
                 x2 - r, y1,
                 x2, y1,
@@ -223,8 +273,10 @@ class AppSessionMixin:
                 x1, y2 - r,
                 x1, y1 + r,
                 x1, y1,
-            ]
-            return reel.create_polygon(points, smooth=True, splinesteps=20, **kwargs)
+            )
+            # The band sits under the moving names and is re-rasterized in the
+            # damaged area every frame; 12 steps per corner still reads as round.
+            return reel.create_polygon(points, smooth=True, splinesteps=12, **kwargs)
 
         _round_rect(
             pad,
@@ -249,42 +301,42 @@ class AppSessionMixin:
             width=0,
         )
 
-        def _format_name(name: str) -> str:
-            s = (name or "").strip()
-            if not s:
-                return s
-            if " " in s:
-                has_cjk = self._contains_cjk(s)
-                has_latin = any(("A" <= ch <= "Z") or ("a" <= ch <= "z") for ch in s)
-                if has_cjk and has_latin:
-                    left, right = s.split(None, 1)
-                    return f"{left} {right}"
-            return s
-
-        font_cache: dict[tuple[str, str, int, int, str], tuple] = {}
-        max_text_w = canvas_w - (pad * 2) - self.fs(110)
+        formatted_names = self._formatted_names
 
-        def _fit_font(text: str, base_px: int, min_px: int, weight="bold") -> tuple:
-            family = self._heading_font_family_for_text(text)
-            key = (family, text, base_px, min_px, weight)
-            if key in font_cache:
-                return font_cache[key]
-
-            size = self.ft(base_px)
-            min_size = self.ft(min_px)
-            fnt = tkfont.Font(family=family, size=size, weight=weight)
+        def _format_name(name: str) -> str:
+            text = formatted_names.get(name)
+            if text is None:
+                text = formatted_names[name] = self._format_reel_name(name)
+            return text
 
-            while size > min_size and fnt.measure(text) > max_text_w:
-                size -= 1
-                fnt.configure(size=size)
+        max_text_w = canvas_w - (pad * 2) - self.fs(110)
 
-            font_cache[key] = (family, size, weight)
-            return font_cache[key]
+        def _fit_font(text: str, base_px: int, min_px: int, weight="bold") -> tkfont.Font:
+            # Shares _fit_font_to_width's bisecting search and memo.
+            return self._fit_font_to_width(
+                text,
+                max_text_w,
+                base_px,
+                min_px,
+                weight=weight,
+                family=self._heading_font_family_for_text(text),
+            )
 
-        pool = self.session_students[:] if self.session_students else [final_student]
-        prev_raw = random.choice(pool)
-        cur_raw = random.choice(pool)
-        next_raw = random.choice(pool)
+        if slot_effect_enabled:
+            # choices() only reads the pool, so the live session list needs no copy.
+            pool = self.session_students or [final_student]
+            # Draw every filler name the reel can show up front (the reel never
+            # turns faster than its top speed); the frame loop just walks it.
+            roll_names = self._rng.choices(pool, k=int(duration * _REEL_MAX_ROWS_PER_SEC) + 32)
+        else:
+            # Static countdown: the reel never turns, so it needs no filler.
+            roll_names = [final_student] * 3
+        # Display text for every ring slot, formatted before the spin starts
+        # so rotating a row is a list index rather than a memo lookup.
+        roll_text = [_format_name(name) for name in roll_names]
+        roll_len = len(roll_names)
+        roll_idx = 3
+        prev_raw, cur_raw, next_raw = roll_names[:3]
 
         dim = secondary
         small_px = 21
@@ -295,42 +347,81 @@ class AppSessionMixin:
         t_prev = reel.create_text(
             cx,
             cy - row_h,
-            text=_format_name(prev_raw),
+            text=roll_text[0],
             fill=dim,
             anchor="center",
             justify="center",
         )
-        t_cur = reel.create_text(cx, cy, text=_format_name(cur_raw), fill=fg, anchor="center", justify="center")
+        t_cur = reel.create_text(cx, cy, text=roll_text[1], fill=fg, anchor="center", justify="center")
         t_next = reel.create_text(
             cx,
             cy + row_h,
-            text=_format_name(next_raw),
+            text=roll_text[2],
             fill=dim,
             anchor="center",
             justify="center",
         )
 
-        def _style_item(item, y_pos: float):
-            d = abs(y_pos - cy) / max(1, row_h)
-            d = min(1.0, d)
-            scale = (1.0 - d) ** 2
-            size_px = int(round(small_px + (big_px - small_px) * scale))
-            min_px = int(round(min_small_px + (min_big_px - min_small_px) * scale))
-            text = reel.itemcget(item, "text")
-            reel.itemconfig(
-                item,
-                font=_fit_font(text, size_px, min_px),
-                fill=fg if scale >= 0.92 else dim,
+        # Last text/style pushed to each reel item, so frames only issue Tk
+        # calls for values that actually changed.
+        item_text = {
+            t_prev: roll_text[0],
+            t_cur: roll_text[1],
+            t_next: roll_text[2],
+        }
+        item_style = {t_prev: None, t_cur: None, t_next: None}
+        tk_call = reel.tk.call
+        reel_w = reel._w
+        # Moves all three rows in one Python-to-Tcl crossing per frame.
+        reel.tk.eval(
+            "proc ::studentselector_reel_coords {w a b c x y1 y2 y3} "
+            "{$w coords $a $x $y1; $w coords $b $x $y2; $w coords $c $x $y3}"
+        )
+
+        def _set_text(item, text: str):
+            if item_text[item] != text:
+                item_text[item] = text
+                reel.itemconfig(item, text=text)
+
+        # Row styling by closeness to centre, quantized to style_steps buckets:
+        # (size_px, min_px, fill) per bucket, and the fitted style per
+        # (text, bucket) so frames skip the CJK scan and font fit lookups.
+        style_steps = 32
+        style_lut = [
+            (
+                int(round(small_px + (big_px - small_px) * scale)),
+                int(round(min_small_px + (min_big_px - min_small_px) * scale)),
+                fg if scale >= 0.92 else dim,
             )
+            for scale in (i / style_steps for i in range(style_steps + 1))
+        ]
+        style_memo: dict[tuple[str, int], tuple] = {}
+        inv_row_h = 1.0 / max(1, row_h)
 
-        progress = ttk.Progressbar(
+        def _style_item(item, y_pos: float):
+            d = min(1.0, abs(y_pos - cy) * inv_row_h)
+            step = int((1.0 - d) ** 2 * style_steps + 0.5)
+            key = (item_text[item], step)
+            style = style_memo.get(key)
+            if style is None:
+                size_px, min_px, fill = style_lut[step]
+                style = style_memo[key] = (_fit_font(key[0], size_px, min_px), fill)
+            if item_style[item] != style:
+                item_style[item] = style
+                reel.itemconfig(item, font=style[0], fill=style[1])
+
+        # Plain canvas bar: a single rectangle resize per percent is cheaper
+        # than restyling a themed ttk progressbar.
+        progress_h = self.fs(12)
+        progress = tk.Canvas(
             stage_body,
-            mode="determinate",
-            maximum=100,
-            bootstyle="primary",
-            style="Slot.Horizontal.TProgressbar",
+            height=progress_h,
+            bg=p["line_soft"],
+            highlightthickness=0,
+            bd=0,
         )
         progress.pack(fill="x", pady=(self.fs(8), 0))
+        progress_bar = progress.create_rectangle(0, 0, 0, progress_h, fill=primary, width=0)
 
         buttons = ttk.Frame(main, style="SlotBg.TFrame", padding=(0, self.fs(12), 0, 0))
         buttons.pack(fill="x")
@@ -344,41 +435,117 @@ class AppSessionMixin:
 
         win.after(max(0, int(duration * 1000) - 200), _timeup_safe)
 
-        start_time = time.time()
+        start_time = time.perf_counter()
         last_time = start_time
         phase = 0.0
 
-        max_rows_per_sec = 7.5
-        min_rows_per_sec = 1.0
-        cur_rows_per_sec = max_rows_per_sec
+        cur_rows_per_sec = _REEL_MAX_ROWS_PER_SEC
         speed_smooth_tau = 0.18
+        inv_speed_tau = 1.0 / speed_smooth_tau
 
         final_mode = False
         final_roll_time = 0.65
         final_start_time = None
         final_start_phase = 0.0
 
+        # Per-frame divisions become multiplies by these.
+        inv_duration = 1.0 / max(0.001, duration)
+        inv_final_roll = 1.0 / final_roll_time
+        perf_counter = time.perf_counter
+
+        frame_interval = 0.016
+        min_frame_gap = 0.010
+        next_frame_at = start_time
+        frame_cmd = None  # Tcl name for _frame, registered once below
+
+        def _schedule_frame():
+            nonlocal next_frame_at
+            # Aim each frame at a fixed cadence from the start time so render
+            # cost does not accumulate as drift between frames.
+            next_frame_at += frame_interval
+            now = perf_counter()
+            delay_ms = int(round((next_frame_at - now) * 1000))
+            if delay_ms < 1:
+                next_frame_at = now
+                delay_ms = 1
+            # Don't let the cadence overshoot the lock-in or the landing; wake
+            # on the deadline so the reel settles on time, not a frame late.
+            deadline = final_start_time + final_roll_time if final_mode else start_time + duration
+            deadline_ms = max(1, int((deadline - now) * 1000) + 1)
+            if deadline_ms < delay_ms:
+                next_frame_at = now + deadline_ms / 1000
+                delay_ms = deadline_ms
+            # win.after() would register and tear down a fresh Tcl command
+            # for every frame; reuse the one registered for _frame instead.
+            tk_call("after", delay_ms, frame_cmd)
+
+        last_timer_second = None
+
         def _update_timer_label(elapsed: float):
+            nonlocal last_timer_second
             remaining = max(0, duration - elapsed)
-            timer_value.config(text=self._format_seconds(max(1, remaining)) if remaining > 0 else "Locking")
-
-        def _rotate_once():
-            nonlocal prev_raw, cur_raw, next_raw
-            prev_raw, cur_raw = cur_raw, next_raw
-            next_raw = random.choice(pool)
-
-            reel.itemconfig(t_prev, text=_format_name(prev_raw))
-            reel.itemconfig(t_cur, text=_format_name(cur_raw))
-            reel.itemconfig(t_next, text=_format_name(next_raw))
+            # The label shows whole seconds; only format and push text when
+            # that second changes rather than on every frame.
+            second = int(round(max(1, remaining))) if remaining > 0 else 0
+            if second == last_timer_second:
+                return
+            last_timer_second = second
+            timer_value.config(text=self._format_seconds(second) if second else "Locking")
+
+        last_pct = -1
+        progress_w = 0
+        progress_path = progress._w
+
+        def _draw_progress():
+            fill_w = progress_w * max(0, last_pct) / 100
+            tk_call(progress_path, "coords", progress_bar, 0, 0, fill_w, progress_h)
+
+        def _on_progress_resize(event):
+            # Track the bar's width from <Configure> rather than querying
+            # winfo_width() from the frame loop.
+            nonlocal progress_w
+            progress_w = event.width
+            _draw_progress()
+
+        progress.bind("<Configure>", _on_progress_resize)
+
+        def _update_progress(elapsed: float):
+            nonlocal last_pct
+            pct = min(100, int(min(elapsed, duration) * inv_duration * 100))
+            # The bar only moves in whole percents; skip the Tk call otherwise.
+            if pct != last_pct:
+                last_pct = pct
+                _draw_progress()
+
+        def _rotate(rows: int):
+            nonlocal prev_raw, cur_raw, next_raw, roll_idx, t_prev, t_cur, t_next
+            roll_idx += rows
+            i_prev, i_cur, i_next = (roll_idx - 3) % roll_len, (roll_idx - 2) % roll_len, (roll_idx - 1) % roll_len
+            prev_raw, cur_raw, next_raw = roll_names[i_prev], roll_names[i_cur], roll_names[i_next]
+
+            if rows == 1:
+                # The rows already hold prev/cur text; rotate the handles so the
+                # row that scrolled off the top re-enters at the bottom and only
+                # it needs new text. _render repositions all three.
+                t_prev, t_cur, t_next = t_cur, t_next, t_prev
+                _set_text(t_next, roll_text[i_next])
+            else:
+                # A stalled frame skipped several rows; jump straight to where
+                # the reel is now instead of replaying every row in between.
+                _set_text(t_prev, roll_text[i_prev])
+                _set_text(t_cur, roll_text[i_cur])
+                _set_text(t_next, roll_text[i_next])
 
         def _render(phase_px: float):
             y_prev = (cy - row_h) - phase_px
             y_cur = cy - phase_px
             y_next = (cy + row_h) - phase_px
 
-            reel.coords(t_prev, cx, y_prev)
-            reel.coords(t_cur, cx, y_cur)
-            reel.coords(t_next, cx, y_next)
+            tk_call(
+                "::studentselector_reel_coords",
+                reel_w, t_prev, t_cur, t_next,
+                cx, y_prev, y_cur, y_next,
+            )
 
             _style_item(t_prev, y_prev)
             _style_item(t_cur, y_cur)
@@ -393,10 +560,14 @@ class AppSessionMixin:
                 t_cur, t_prev = t_prev, t_cur
 
             cur_raw = final_student
-            reel.itemconfig(t_cur, text=_format_name(cur_raw))
-            reel.itemconfig(t_cur, font=_fit_font(reel.itemcget(t_cur, "text"), big_px, min_big_px))
-            reel.itemconfig(band, fill=self._shade(success, panel, 0.68), outline="")
-            reel.itemconfig(t_cur, fill=success)
+            final_text = _format_name(cur_raw)
+            reel.itemconfig(
+                t_cur,
+                text=final_text,
+                font=_fit_font(final_text, big_px, min_big_px),
+                fill=success,
+            )
+            reel.itemconfig(band, fill=self._shade(success, panel, 0.68))
             reel.itemconfig(t_prev, state="hidden")
             reel.itemconfig(t_next, state="hidden")
 
@@ -411,8 +582,7 @@ class AppSessionMixin:
 
             self._remember_selected_student(class_name, final_student)
 
-            if final_student in self.session_students:
-                self.session_students.remove(final_student)
+            self._take_session_student(final_student, final_idx)
             remaining_value.config(text=f"{len(self.session_students)} left")
 
             self._render_grading_controls(win, buttons, class_name, final_student)
@@ -420,11 +590,18 @@ class AppSessionMixin:
         def _frame():
             nonlocal last_time, phase, final_mode, final_start_time, final_start_phase, next_raw, cur_rows_per_sec
 
-            if (not alive) or (not win.winfo_exists()):
+            # on_close clears alive before destroying the window, and the
+            # grading controls only appear once the loop has finished, so the
+            # flag alone covers every destroy path without a Tk round-trip.
+            if not alive:
                 return
 
-            now = time.time()
-            dt = max(0.001, now - last_time)
+            now = perf_counter()
+            if now - last_time < min_frame_gap:
+                # Timer events delivered back to back; don't redraw twice.
+                _schedule_frame()
+                return
+            dt = now - last_time
             last_time = now
             elapsed = now - start_time
             _update_timer_label(elapsed)
@@ -434,18 +611,21 @@ class AppSessionMixin:
                 final_start_time = now
                 final_start_phase = phase
                 next_raw = final_student
-                reel.itemconfig(t_next, text=_format_name(next_raw))
+                _set_text(t_next, _format_name(next_raw))
 
             if not final_mode:
-                t = max(0.0, min(1.0, elapsed / max(0.001, duration)))
-                target_rows = min_rows_per_sec + (max_rows_per_sec - min_rows_per_sec) * ((1.0 - t) ** 2.1)
-                alpha = min(1.0, dt / max(0.001, speed_smooth_tau))
+                t = min(1.0, elapsed * inv_duration)
+                target_rows = _REEL_SPEED_CURVE[int(t * _REEL_SPEED_STEPS)]
+                # Exact exponential smoothing for this dt, so the reel eases the
+                # same way at any frame rate and after a stalled frame.
+                alpha = -math.expm1(-dt * inv_speed_tau)
                 cur_rows_per_sec += (target_rows - cur_rows_per_sec) * alpha
                 phase += (cur_rows_per_sec * row_h) * dt
 
-                while phase >= row_h - 1e-6:
-                    phase -= row_h
-                    _rotate_once()
+                rows = int((phase + 1e-6) // row_h)
+                if rows:
+                    phase -= rows * row_h
+                    _rotate(rows)
 
                 _render(phase)
             else:
@@ -453,7 +633,7 @@ class AppSessionMixin:
                     final_start_time = now
                     final_start_phase = phase
 
-                progress_t = min(1.0, (now - final_start_time) / max(0.001, final_roll_time))
+                progress_t = min(1.0, (now - final_start_time) * inv_final_roll)
                 eased = 1.0 - (1.0 - progress_t) ** 3
                 phase = final_start_phase + (row_h - final_start_phase) * eased
                 _render(phase)
@@ -462,38 +642,79 @@ class AppSessionMixin:
                     _finalize(center_item=t_next)
                     return
 
-            progress["value"] = min(100, int(min(elapsed, duration) / max(0.001, duration) * 100))
-            win.after(16, _frame)
+            _update_progress(elapsed)
+            _schedule_frame()
 
         def _frame_no_effect():
-            if (not alive) or (not win.winfo_exists()):
+            if not alive:
                 return
 
-            now = time.time()
+            now = perf_counter()
             elapsed = now - start_time
             _update_timer_label(elapsed)
-            progress["value"] = min(100, int(min(elapsed, duration) / max(0.001, duration) * 100))
+            _update_progress(elapsed)
 
             if elapsed >= duration:
                 _finalize(center_item=t_cur)
                 return
 
-            win.after(50, _frame_no_effect)
+            # Nothing on screen changes between ticks, so sleep until the bar
+            # gains a percent, the label rounds to a new second, or the deadline.
+            remaining = duration - elapsed
+            wait = min(
+                (last_pct + 1) * duration * 0.01 - elapsed,
+                (remaining - 0.5) % 1.0 or 1.0,
+                remaining,
+            )
+            win.after(max(1, int(wait * 1000) + 1), _frame_no_effect)
 
-        _render(0.0)
-        if slot_effect_enabled:
+        def _frame_low_power():
+            nonlocal cur_raw, roll_idx
+            if not alive:
+                return
+
+            now = perf_counter()
+            elapsed = now - start_time
+            _update_timer_label(elapsed)
+            _update_progress(elapsed)
+
+            if elapsed >= duration:
+                _finalize(center_item=t_cur)
+                return
+
+            # One text swap per row at the reel's eased speed; nothing moves.
+            cur_raw = roll_names[roll_idx % roll_len]
+            _set_text(t_cur, roll_text[roll_idx % roll_len])
+            roll_idx += 1
+            _style_item(t_cur, cy)
+
+            rows_per_sec = _REEL_SPEED_CURVE[int(elapsed * inv_duration * _REEL_SPEED_STEPS)]
+            row_ms = int(1000 / rows_per_sec)
+            win.after(max(1, min(row_ms, int((duration - elapsed) * 1000) + 1)), _frame_low_power)
+
+        if slot_effect_enabled and LOW_POWER_REEL:
+            reel.itemconfig(t_prev, state="hidden")
+            reel.itemconfig(t_next, state="hidden")
+            _frame_low_power()
+        elif slot_effect_enabled:
+            _render(0.0)
+            frame_cmd = win.register(_frame)
             _frame()
         else:
             reel.itemconfig(t_prev, state="hidden")
             reel.itemconfig(t_next, state="hidden")
-            reel.itemconfig(t_cur, text="Get ready", fill=fg)
-            reel.itemconfig(t_cur, font=_fit_font("Get ready", small_px, min_small_px))
+            reel.itemconfig(
+                t_cur,
+                text="Get ready",
+                fill=fg,
+                font=_fit_font("Get ready", small_px, min_small_px),
+            )
             _frame_no_effect()
 
     def _render_grading_controls(self, win, button_frame, class_name: str, student_name: str):
-        for w in button_frame.winfo_children():
-            w.destroy()
-
+        # button_frame is the slot window's own, still-empty footer: every
+        # window shows one student and is destroyed once an outcome is picked,
+        # so there is nothing to tear down here.
         p = self.palette
         button_frame.configure(style="SlotBg.TFrame", padding=(0, self.fs(14), 0, 0))
         shell = tk.Frame(button_frame, bg=p["bg"])
@@ -508,8 +729,7 @@ class AppSessionMixin:
             highlightbackground=p["line_soft"],
         )
         card.pack(fill="x")
-        for col in range(4):
-            card.columnconfigure(col, weight=1, uniform="rate")
+        card.columnconfigure((0, 1, 2, 3), weight=1, uniform="rate")
 
         work_area = self._monitor_work_area_for_window(win)
         window_h = self._slot_window_height(work_area=work_area)
@@ -532,8 +752,7 @@ class AppSessionMixin:
             self._remember_selected_student(class_name, student_name)
             self.sound.play_music_once(RATING_SOUNDS.get(rating, ""))
 
-            msg_list = self.messages.get(rating) or []
-            msg = random.choice(msg_list) if msg_list else "Noted."
+            msg = self._next_rating_message(rating)
             anchor_rect = self._capture_window_rect(win)
             anchor_work_area = self._monitor_work_area_for_window(win)
 
@@ -597,10 +816,10 @@ class AppSessionMixin:
             )
 
         actions = [
-            ("A*", self._rating_meta("A*")["label"], "GradeAStar.TButton", lambda: apply_rating("A*")),
-            ("A", self._rating_meta("A")["label"], "GradeA.TButton", lambda: apply_rating("A")),
-            ("B", self._rating_meta("B")["label"], "GradeB.TButton", lambda: apply_rating("B")),
-            ("C", self._rating_meta("C")["label"], "GradeC.TButton", lambda: apply_rating("C")),
+            ("A*", self._rating_meta("A*")["label"], "GradeAStar.TButton", functools.partial(apply_rating, "A*")),
+            ("A", self._rating_meta("A")["label"], "GradeA.TButton", functools.partial(apply_rating, "A")),
+            ("B", self._rating_meta("B")["label"], "GradeB.TButton", functools.partial(apply_rating, "B")),
+            ("C", self._rating_meta("C")["label"], "GradeC.TButton", functools.partial(apply_rating, "C")),
             ("No Grade", "Skip grading", "NoGrade.TButton", mark_no_grade),
             ("Absent", "Remove for today", "Absent.TButton", mark_absent),
         ]
@@ -674,13 +893,16 @@ class AppSessionMixin:
     ):
         target_work_area = anchor_work_area or self._desktop_work_area()
         msg_win = ttk.Toplevel(self.root)
+        # Build hidden and map once fully laid out, so Tk does not resize and
+        # repaint the popup as each child widget is packed.
+        msg_win.withdraw()
         msg_win.title(f"{class_name} - {title}")
         msg_win.attributes("-topmost", True)
         msg_win.geometry(
             self._slot_window_geometry(
                 parent_w=WINDOW_WIDTH,
                 anchor_rect=anchor_rect,
-                anchor_work_area=anchor_work_area,
+                anchor_work_area=target_work_area,
             )
         )
         msg_win.minsize(self.fs(760), self._slot_window_height(work_area=target_work_area))
@@ -727,24 +949,6 @@ class AppSessionMixin:
         body_card.grid_rowconfigure(0, weight=1)
         body_card.grid_columnconfigure(0, weight=1)
 
-        quote = tk.Frame(body_card, bg=p["panel"])
-        quote.grid(row=0, column=0, sticky="nsew")
-        tk.Label(quote, text="“", font=self.hf(56, "bold"), bg=p["panel"], fg=p["accent"]).pack(anchor="center")
-        tk.Label(
-            quote,
-            text=message,
-            font=self.f(30),
-            bg=p["panel"],
-            fg=p["text_light"],
-            wraplength=message_wrap,
-            justify="center",
-        ).pack(fill="both", expand=True, pady=(0, self.fs(10)))
-
-        try:
-            quote.destroy()
-        except Exception:
-            pass
-
         tk.Label(
             body_card,
             text=message,
@@ -757,8 +961,7 @@ class AppSessionMixin:
 
         btns = tk.Frame(outer, bg=p["bg"])
         btns.grid(row=2, column=0, sticky="ew")
-        btns.grid_columnconfigure(0, weight=1)
-        btns.grid_columnconfigure(1, weight=1)
+        btns.grid_columnconfigure((0, 1), weight=1)
 
         def next_student():
             next_anchor_rect = self._capture_window_rect(msg_win)
@@ -787,10 +990,14 @@ class AppSessionMixin:
             command=exit_to_main,
         ).grid(row=0, column=1, sticky="ew", padx=(self.fs(10), 0), ipady=self.fs(12))
 
+        msg_win.update_idletasks()
+        msg_win.deiconify()
+
     def _show_grades_summary(self):
         self.exit_requested = False
 
         win = ttk.Toplevel(self.root)
+        win.withdraw()
         win.title("Session Summary")
         win.attributes("-topmost", True)
         win.geometry(f"{self.fs(860)}x{self.fs(760)}+{self.fs(30)}+{self.fs(80)}")
@@ -820,7 +1027,9 @@ class AppSessionMixin:
 
         win.bind("<Escape>", on_escape)
 
-        counts = {rating: 0 for rating in ("A*", "A", "B", "C")}
+        # One meta lookup per rating rather than per chip and per student row.
+        meta_by_rating = {rating: self._rating_meta(rating) for rating in ("A*", "A", "B", "C")}
+        counts = dict.fromkeys(meta_by_rating, 0)
         for rating in grades.values():
             counts[rating] = counts.get(rating, 0) + 1
         metrics = {
@@ -856,10 +1065,10 @@ class AppSessionMixin:
         chip_row = tk.Frame(header, bg=p["bg"])
         chip_row.grid(row=0, column=1, rowspan=2, sticky="e", padx=(self.fs(18), 0))
         chip_data = [
-            ("A*", counts.get("A*", 0), self._rating_meta("A*")["bg"]),
-            ("A", counts.get("A", 0), self._rating_meta("A")["bg"]),
-            ("B", counts.get("B", 0), self._rating_meta("B")["bg"]),
-            ("C", counts.get("C", 0), self._rating_meta("C")["bg"]),
+            ("A*", counts.get("A*", 0), meta_by_rating["A*"]["bg"]),
+            ("A", counts.get("A", 0), meta_by_rating["A"]["bg"]),
+            ("B", counts.get("B", 0), meta_by_rating["B"]["bg"]),
+            ("C", counts.get("C", 0), meta_by_rating["C"]["bg"]),
             ("No Grade", len(ungraded), p["text_dark"]),
             ("Absent", len(absent), p["danger"]),
         ]
@@ -931,6 +1140,12 @@ class AppSessionMixin:
             canvas.bind("<Configure>", _stretch_rows)
 
             row_number = 1
+            # Resolved once for the whole list rather than per student row.
+            row_pad_x, row_pad_y = self.fs(14), self.fs(12)
+            pill_pad_x, pill_pad_y = self.fs(10), self.fs(5)
+            index_font = self.mf(12, "bold")
+            name_font = self.hf(16, "bold")
+            pill_font = self.hf(12, "bold")
 
             def add_section(title: str):
                 section = tk.Frame(rows, bg=p["bg_alt"], padx=self.fs(14), pady=self.fs(12))
@@ -948,14 +1163,14 @@ class AppSessionMixin:
                 nonlocal row_number
                 idx = row_number
                 row_bg = p["panel"] if idx % 2 else p["panel_alt"]
-                row = tk.Frame(rows, bg=row_bg, padx=self.fs(14), pady=self.fs(12))
+                row = tk.Frame(rows, bg=row_bg, padx=row_pad_x, pady=row_pad_y)
                 row.pack(fill="x", expand=True)
                 row.grid_columnconfigure(1, weight=1)
 
                 tk.Label(
                     row,
                     text=f"{idx:02d}",
-                    font=self.mf(12, "bold"),
+                    font=index_font,
                     bg=row_bg,
                     fg=p["text_muted"],
                     width=4,
@@ -964,7 +1179,7 @@ class AppSessionMixin:
                 tk.Label(
                     row,
                     text=student,
-                    font=self.hf(16, "bold"),
+                    font=name_font,
                     bg=row_bg,
                     fg=p["text_light"],
                     anchor="w",
@@ -973,11 +1188,11 @@ class AppSessionMixin:
                 pill = tk.Label(
                     row,
                     text=pill_text,
-                    font=self.hf(12, "bold"),
+                    font=pill_font,
                     bg=pill_bg,
                     fg=pill_fg,
-                    padx=self.fs(10),
-                    pady=self.fs(5),
+                    padx=pill_pad_x,
+                    pady=pill_pad_y,
                 )
                 pill.grid(row=0, column=2, sticky="e")
                 row_number += 1
@@ -985,7 +1200,7 @@ class AppSessionMixin:
             if grades:
                 add_section("Grades")
                 for student, rating in grades.items():
-                    meta = self._rating_meta(rating)
+                    meta = meta_by_rating.get(rating) or self._rating_meta(rating)
                     add_row(student, f"{rating}  {meta['label']}", meta["bg"], meta["fg"])
 
             if ungraded:
@@ -1000,8 +1215,7 @@ class AppSessionMixin:
 
         btns = tk.Frame(outer, bg=p["bg"])
         btns.grid(row=2, column=0, sticky="ew")
-        btns.grid_columnconfigure(0, weight=1)
-        btns.grid_columnconfigure(1, weight=1)
+        btns.grid_columnconfigure((0, 1), weight=1)
 
         active_ready = bool(self.active_class and self.session_students_by_class.get(self.active_class))
 
@@ -1025,3 +1239,6 @@ class AppSessionMixin:
                 style="Utility.TButton",
                 command=win.destroy,
             ).grid(row=0, column=0, columnspan=2, sticky="ew", ipady=self.fs(10))
+
+        win.update_idletasks()
+        win.deiconify()
@@ -1,5 +1,31 @@
+import functools
+import re
 import tkinter.font as tkfont
 
+# CJK Unified (+ Ext A), Hiragana/Katakana and Hangul syllables; matched in C.
+_CJK_RE = re.compile("[\u4e00-\u9fff\u3400-\u4dbf\u3040-\u30ff\uac00-\ud7af]")
+_LATIN_RE = re.compile("[A-Za-z]")
+
+
+@functools.lru_cache(maxsize=None)
+def _shade_hex(c1: str, c2: str, t: float) -> str:
+    # Palette colours and mix ratios are fixed, so each pair is mixed once.
+    h1 = c1.lstrip("#")
+    h2 = c2.lstrip("#")
+    try:
+        if len(h1) != 6 or len(h2) != 6:
+            raise ValueError
+        v1 = int(h1, 16)
+        v2 = int(h2, 16)
+    except ValueError:
+        return h1
+    mixed = 0
+    for shift in (16, 8, 0):
+        a = (v1 >> shift) & 0xFF
+        b = (v2 >> shift) & 0xFF
+        mixed |= int(a + (b - a) * t) << shift
+    return f"#{mixed:06x}"
+
 
 class AppStyleMixin:
     def _compute_classroom_ui_scale(self) -> float:
@@ -52,36 +78,60 @@ class AppStyleMixin:
         return fallback
 
     def _contains_cjk(self, text: str) -> bool:
-        for ch in text or "":
-            o = ord(ch)
-            if (
-                0x4E00 <= o <= 0x9FFF
-                or 0x3400 <= o <= 0x4DBF
-                or 0x3040 <= o <= 0x30FF
-                or 0xAC00 <= o <= 0xD7AF
-            ):
-                return True
-        return False
+        return _CJK_RE.search(text or "") is not None
+
+    def _format_reel_name(self, name: str) -> str:
+        s = (name or "").strip()
+        if not s:
+            return s
+        if " " in s:
+            has_cjk = self._contains_cjk(s)
+            has_latin = _LATIN_RE.search(s) is not None
+            if has_cjk and has_latin:
+                left, right = s.split(None, 1)
+                return f"{left} {right}"
+        return s
 
     def _heading_font_family_for_text(self, text: str) -> str:
         if self._contains_cjk(text):
             return self.CJK_FONT_FAMILY
         return self.HEADING_FONT_FAMILY
 
-    def f(self, px: int, weight: str | None = None) -> tuple:
-        if weight:
-            return (self.FONT_FAMILY, self.ft(px), weight)
-        return (self.FONT_FAMILY, self.ft(px))
+    def _named_font(self, family: str, px: int, weight: str | None) -> tkfont.Font:
+        """
+        Intern one named Tk font per (family, size, weight) so widgets share a
+        font handle instead of Tk re-parsing a font tuple for each of them.
+        """
+        return self._interned_font(family, self.ft(px), weight)
+
+    def _interned_font(self, family: str, size: int, weight: str | None) -> tkfont.Font:
+        key = (family, size, weight or "normal")
+        fnt = self._font_cache.get(key)
+        if fnt is None:
+            fnt = tkfont.Font(root=self.root, family=key[0], size=key[1], weight=key[2])
+            self._font_cache[key] = fnt
+        return fnt
+
+    def f(self, px: int, weight: str | None = None) -> tkfont.Font:
+        return self._named_font(self.FONT_FAMILY, px, weight)
 
-    def hf(self, px: int, weight: str | None = None) -> tuple:
-        if weight:
-            return (self.HEADING_FONT_FAMILY, self.ft(px), weight)
-        return (self.HEADING_FONT_FAMILY, self.ft(px))
+    def hf(self, px: int, weight: str | None = None) -> tkfont.Font:
+        return self._named_font(self.HEADING_FONT_FAMILY, px, weight)
 
-    def mf(self, px: int, weight: str | None = None) -> tuple:
-        if weight:
-            return (self.MONO_FONT_FAMILY, self.ft(px), weight)
-        return (self.MONO_FONT_FAMILY, self.ft(px))
+    def mf(self, px: int, weight: str | None = None) -> tkfont.Font:
+        return self._named_font(self.MONO_FONT_FAMILY, px, weight)
+
+    def _measure_font(self, family: str, weight: str) -> tkfont.Font:
+        """
+        Scratch font reused for measure() calls; callers set its size first.
+        Kept separate from the interned display fonts, which must not resize.
+        """
+        key = (family, weight)
+        fnt = self._measure_fonts.get(key)
+        if fnt is None:
+            fnt = tkfont.Font(root=self.root, family=family, weight=weight)
+            self._measure_fonts[key] = fnt
+        return fnt
 
     def _fit_font_to_width(
         self,
@@ -91,21 +141,37 @@ class AppStyleMixin:
         min_px: int,
         weight: str = "bold",
         family: str | None = None,
-    ) -> tuple:
+    ) -> tkfont.Font:
         """
         Prevent the title from clipping in the narrow dock window by shrinking
-        the font until it fits (or hits min).
+        the font until it fits (or hits min). Returns an interned named font.
         """
         family = family or self.HEADING_FONT_FAMILY
+        key = (family, text, max_px, start_px, min_px, weight, self.ui_scale)
+        cached = self._fit_cache.get(key)
+        if cached is not None:
+            return cached
+
         size = self.ft(start_px)
         min_size = self.ft(min_px)
 
-        test_font = tkfont.Font(family=family, size=size, weight=weight)
-        while size > min_size and test_font.measure(text) > max_px:
-            size -= 1
-            test_font.configure(size=size)
-
-        return (family, size, weight)
+        test_font = self._measure_font(family, weight)
+        test_font.configure(size=size)
+        if size > min_size and test_font.measure(text) > max_px:
+            # Bisect for the largest size that fits instead of stepping down
+            # one point per measure() round-trip.
+            lo, hi = min_size, size - 1
+            while lo < hi:
+                mid = (lo + hi + 1) // 2
+                test_font.configure(size=mid)
+                if test_font.measure(text) <= max_px:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            size = lo
+
+        self._fit_cache[key] = self._interned_font(family, size, weight)
+        return self._fit_cache[key]
 
     def _apply_classroom_font_defaults(self):
         base = self.f(18)
@@ -115,41 +181,37 @@ class AppStyleMixin:
         self.root.option_add("*Text.Font", base)
 
         # TTK defaults
-        self.style.configure(".", font=base)
-        self.style.configure("TLabel", font=base)
-        self.style.configure("secondary.TLabel", font=self.f(16))
-
-        # Labelframe titles
-        self.style.configure("TLabelframe.Label", font=self.hf(18, "bold"))
-        for bs in ("primary", "secondary", "info", "success", "warning", "danger"):
-            self.style.configure(f"{bs}.TLabelframe.Label", font=self.hf(18, "bold"))
-
-        # Inputs
-        self.style.configure("TCombobox", font=self.f(20))
-        self.style.configure("TSpinbox", font=self.f(20))
-        self.style.configure("TEntry", font=self.f(20))
-
-        # Buttons
-        self.style.configure("TButton", font=self.hf(16, "bold"))
-        for bs in ("primary", "secondary", "success", "info", "warning", "danger"):
-            self.style.configure(f"{bs}.TButton", font=self.hf(16, "bold"))
-
-        # Checkbuttons/toggles
-        self.style.configure("TCheckbutton", font=self.f(16))
-
-        # Slot window progressbar: thicker for projection
+        label_title = self.hf(18, "bold")
+        button = self.hf(16, "bold")
+        font_specs = [
+            (".", base),
+            ("TLabel", base),
+            # Labelframe titles
+            ("TLabelframe.Label", label_title),
+            # Inputs
+            ("TCombobox", self.f(20)),
+            ("TSpinbox", self.f(20)),
+            ("TEntry", self.f(20)),
+            # Buttons
+            ("TButton", button),
+            # Checkbuttons/toggles
+            ("TCheckbutton", self.f(16)),
+        ]
+        # Colour bootstyle variants (primary.TButton, secondary.TButton, ...)
+        # are still used, e.g. by the ttkbootstrap Messagebox dialogs, but they
+        # inherit their font from TButton, so per-variant font specs are redundant.
+
+        # Apply every font default in one Tcl round-trip instead of one
+        # style.configure() call per style name.
         try:
-            self.style.configure("Slot.Horizontal.TProgressbar", thickness=self.fs(12))
-            self.style.configure(
-                "Slot.Horizontal.TProgressbar",
-                troughcolor=self.palette["line_soft"],
-                background=self.palette["accent"],
-                bordercolor=self.palette["line_soft"],
-                lightcolor=self.palette["accent"],
-                darkcolor=self.palette["accent"],
+            self.root.tk.call(
+                "apply",
+                "{specs} {foreach {name font} $specs {ttk::style configure $name -font $font}}",
+                tuple(item for spec in font_specs for item in spec),
             )
         except Exception:
-            pass
+            for name, font in font_specs:
+                self.style.configure(name, font=font)
 
         # Match Tk's scaling to the current monitor DPI instead of forcing a
         # fixed value that can become soft on external displays.
@@ -159,15 +221,7 @@ class AppStyleMixin:
             pass
 
     def _shade(self, c1: str, c2: str, t: float) -> str:
-        try:
-            c1 = c1.lstrip("#")
-            c2 = c2.lstrip("#")
-            rgb1 = tuple(int(c1[i:i + 2], 16) for i in (0, 2, 4))
-            rgb2 = tuple(int(c2[i:i + 2], 16) for i in (0, 2, 4))
-            mixed = tuple(int(a + (b - a) * t) for a, b in zip(rgb1, rgb2))
-            return "#{:02x}{:02x}{:02x}".format(*mixed)
-        except Exception:
-            return c1
+        return _shade_hex(c1, c2, t)
 
     def _format_seconds(self, total_seconds: int | float) -> str:
         total = max(1, int(round(float(total_seconds))))
@@ -194,8 +248,7 @@ class AppStyleMixin:
         blocked.update(self.absent_students_by_class.get(class_name, []))
         if class_name in self.session_students_by_class:
             return [student for student in self.session_students_by_class[class_name] if student not in blocked]
-        roster = list(self.classes.get(class_name, []))
-        return [student for student in roster if student not in blocked]
+        return [student for student in self.classes.get(class_name, ()) if student not in blocked]
 
     def _chosen_students_for_class(self, class_name: str | None) -> list[str]:
         if not class_name:
@@ -231,7 +284,7 @@ class AppStyleMixin:
 
     def _class_metrics(self, class_name: str | None = None) -> dict[str, int | str]:
         class_name = class_name or self._active_or_selected_class()
-        roster = list(self.classes.get(class_name, [])) if class_name else []
+        roster = self.classes.get(class_name, ()) if class_name else ()
         session_roster = self._effective_session_roster(class_name)
         grades = self.student_grades_by_class.get(class_name, {})
         ungraded = self.student_ungraded_by_class.get(class_name, [])
@@ -116,8 +116,11 @@ class AppWindowMixin:
         left, top, width, height, _ = monitors[0]
         return left, top, width, height
 
-    def _root_window_size(self) -> tuple[int, int]:
-        _, _, work_w, work_h = self._desktop_work_area()
+    def _root_window_size(
+        self,
+        work_area: tuple[int, int, int, int] | None = None,
+    ) -> tuple[int, int]:
+        _, _, work_w, work_h = work_area or self._desktop_work_area()
         target_w = self.fs(WINDOW_WIDTH)
         min_w = self.fs(440)
         edge_gap = self.fs(24)
@@ -131,8 +134,9 @@ class AppWindowMixin:
         self.root.title("Random Student Selector")
         self.root.attributes("-topmost", True)
 
-        work_left, work_top, work_w, work_h = self._desktop_work_area()
-        window_w, window_h = self._root_window_size()
+        work_area = self._desktop_work_area()
+        work_left, work_top, work_w, work_h = work_area
+        window_w, window_h = self._root_window_size(work_area=work_area)
 
         x = work_left + max(0, work_w - window_w - self.fs(TOP_RIGHT_PADDING_X))
         y = work_top + self.fs(TOP_PADDING_Y)
@@ -262,7 +266,3 @@ class AppWindowMixin:
         y_max = work_top + max(0, work_h - target_h - min_bottom_margin)
         y = max(work_top, min(win.winfo_y(), y_max))
         win.geometry(f"{current_w}x{target_h}+{x}+{y}")
-
-    def _clear_root(self):
-        for w in self.root.winfo_children():
-            w.destroy()
@@ -1,14 +1,19 @@
 import ctypes
 import os
 import sys
+from types import MappingProxyType
 
 
-def resource_path(relative_path: str) -> str:
+# Resolved once; the bundle/script location cannot change while running.
+_BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.dirname(os.path.abspath(__file__))
+
+
+def resource_path(*parts: str) -> str:
     """
     Works in dev (runs next to .py) and in PyInstaller --onefile (runs from _MEIPASS).
+    Pass path components separately so the OS separator is used.
     """
-    base_path = getattr(sys, "_MEIPASS", os.path.dirname(os.path.abspath(__file__)))
-    return os.path.join(base_path, relative_path)
+    return os.path.join(_BASE_PATH, *parts)
 
 
 def enable_windows_high_dpi() -> None:
@@ -66,29 +71,34 @@ SLOT_PANEL_MIN_H = 560
 SLOT_PANEL_MARGIN_RIGHT = 20
 SLOT_PANEL_Y = 80
 
-STUDENTS_CSV = resource_path(r"assets\students.csv")
-MESSAGES_CSV = resource_path(r"assets\messages.csv")
+STUDENTS_CSV = resource_path("assets", "students.csv")
+MESSAGES_CSV = resource_path("assets", "messages.csv")
 
-INTRO_MUSIC = resource_path(r"assets\welcome.mp3")
-CLOSING_MUSIC = resource_path(r"assets\closing.mp3")
+INTRO_MUSIC = resource_path("assets", "welcome.mp3")
+CLOSING_MUSIC = resource_path("assets", "closing.mp3")
 
-SLOT_SOUND_SHORT = resource_path(r"assets\select_student.mp3")
-SLOT_SOUND_MEDIUM = resource_path(r"assets\medium_slot.mp3")
-SLOT_SOUND_LONG = resource_path(r"assets\long_slot.mp3")
-TIMEUP_SOUND = resource_path(r"assets\timeup.mp3")
+SLOT_SOUND_SHORT = resource_path("assets", "select_student.mp3")
+SLOT_SOUND_MEDIUM = resource_path("assets", "medium_slot.mp3")
+SLOT_SOUND_LONG = resource_path("assets", "long_slot.mp3")
+TIMEUP_SOUND = resource_path("assets", "timeup.mp3")
 
-RATING_SOUNDS = {
-    "A*": resource_path(r"assets\sound_a_star.mp3"),
-    "A": resource_path(r"assets\sound_a.mp3"),
-    "B": resource_path(r"assets\sound_b.mp3"),
-    "C": resource_path(r"assets\sound_c.mp3"),
-}
+RATING_SOUNDS = MappingProxyType({
+    "A*": resource_path("assets", "sound_a_star.mp3"),
+    "A": resource_path("assets", "sound_a.mp3"),
+    "B": resource_path("assets", "sound_b.mp3"),
+    "C": resource_path("assets", "sound_c.mp3"),
+})
 
 SHORT_MAX = 4.99
 MEDIUM_MAX = 19.99
 
-TICK_MIN_MS = 60
-TICK_MAX_MS = 300
+# SELECTOR_LOW_POWER=1 swaps the scrolling reel for a single name that flips
+# in place (no per-frame canvas moves/restyles) on weak classroom PCs.
+LOW_POWER_REEL = os.environ.get("SELECTOR_LOW_POWER", "").strip() == "1"
+
+# SELECTOR_SEED=<any text> seeds the picker so a session's picks, reel
+# filler and feedback messages can be replayed; unset means a fresh seed.
+RNG_SEED = os.environ.get("SELECTOR_SEED", "").strip() or None
 
 PALETTE = {
     "bg": "#f3ede3",
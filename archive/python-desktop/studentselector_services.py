@@ -1,33 +1,55 @@
+import atexit
 import csv
+import hashlib
 import os
+import pickle
+import sys
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 # -------------------------
 # Audio Manager (resilient)
 # -------------------------
 
+# Mixer buffer in sample frames: ~23 ms at 44.1 kHz. Small enough that cues
+# land on the button press, large enough to avoid underruns on slow PCs.
+MIXER_BUFFER = 1024
+
 class SoundManager:
     """
     Uses pygame.mixer if available. Missing files or mixer errors degrade silently.
     - music channel: intro/closing/slot loop/rating one-shots (mutually exclusive)
     - sound channel: timeup (attempts pygame.mixer.Sound; falls back if needed)
     - self.enabled flag + set_enabled() to globally mute/unmute audio.
+    - preload: asset paths decoded into pygame.mixer.Sound objects up front so
+      playback does not reopen and decode the file on every cue.
+    - pygame import, mixer init and preloading run on a background thread so
+      the window can paint first; cues requested before the mixer is up are dropped.
+      At exit the preload is stopped and joined before the mixer is quit.
+    - uncached cues stream through mixer.music, loaded on a single worker
+      thread so opening the file never stalls the Tk thread.
     """
-    def __init__(self):
+    def __init__(self, preload=()):
         self._pygame = None
         self._mixer_ok = False
         self.enabled = True
         self._winsound = None
+        self._sounds = {}
+        self._current = None
+        self._current_path: str | None = None
+        self._exists: dict[str, bool] = {}
+        # Bumped by every stop/start so a queued mixer.music load that has
+        # been superseded does not start playing afterwards.
+        self._music_gen = 0
+        self._music_lock = threading.Lock()
+        self._music_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="music-load")
+        self._closing = threading.Event()
 
-        try:
-            import pygame
-            self._pygame = pygame
-            pygame.mixer.init()
-            self._mixer_ok = True
-        except Exception:
-            self._pygame = None
-            self._mixer_ok = False
+        self._init_thread = threading.Thread(target=self._init_mixer, args=(tuple(preload),), daemon=True)
+        self._init_thread.start()
+        atexit.register(self._shutdown)
 
         try:
             import winsound
@@ -35,6 +57,43 @@ class SoundManager:
         except Exception:
             self._winsound = None
 
+    def _init_mixer(self, preload: tuple[str, ...]):
+        try:
+            import pygame
+            # Explicit buffer: the SDL default is small enough to underrun
+            # (pops/"out of buffers") on some PipeWire/ALSA setups.
+            pygame.mixer.pre_init(frequency=44100, size=-16, channels=2, buffer=MIXER_BUFFER)
+            pygame.mixer.init()
+        except Exception:
+            return
+
+        self._pygame = pygame
+        self._mixer_ok = True
+
+        # Cues fall back to mixer.music until their Sound lands in the cache.
+        for path in preload:
+            if self._closing.is_set():
+                return
+            if path in self._sounds or not self._file_exists(path):
+                continue
+            try:
+                self._sounds[path] = pygame.mixer.Sound(path)
+            except Exception:
+                pass
+
+    def _shutdown(self):
+        """
+        atexit hook: stop preloading and let the in-flight decode finish
+        before SDL audio is torn down underneath it.
+        """
+        self._closing.set()
+        self._init_thread.join(timeout=5)
+        if self._mixer_ok:
+            try:
+                self._pygame.mixer.quit()
+            except Exception:
+                pass
+
     def set_enabled(self, enabled: bool):
         """Enable/disable all audio. Disabling stops any currently playing audio."""
         self.enabled = bool(enabled)
@@ -45,50 +104,93 @@ class SoundManager:
                 pass
 
     def _file_exists(self, path: str) -> bool:
-        return bool(path) and os.path.isfile(path)
+        # Cue paths are fixed bundled assets; stat each one only once.
+        exists = self._exists.get(path)
+        if exists is None:
+            exists = self._exists[path] = bool(path) and os.path.isfile(path)
+        return exists
+
+    def _get_sound(self, path: str):
+        """Returns the cached Sound for path, decoding and caching it on a miss."""
+        snd = self._sounds.get(path)
+        if snd is None:
+            snd = self._sounds[path] = self._pygame.mixer.Sound(path)
+        return snd
 
     def stop_music(self):
         if not self._mixer_ok:
             return
+        with self._music_lock:
+            self._music_gen += 1
+            try:
+                if self._current is not None:
+                    self._current.stop()
+                    self._current = None
+                self._current_path = None
+                self._pygame.mixer.music.stop()
+            except Exception:
+                pass
+
+    def _load_and_play_music(self, path: str, loops: int, gen: int):
+        # Runs only on the single music-load worker, so mixer.music is never
+        # loaded from two threads at once; the lock covers the gen checks.
         try:
-            self._pygame.mixer.music.stop()
+            with self._music_lock:
+                if gen != self._music_gen:
+                    return
+            self._pygame.mixer.music.load(path)
+            with self._music_lock:
+                if gen == self._music_gen:
+                    self._pygame.mixer.music.play(loops)
         except Exception:
             pass
 
-    def play_music_once(self, path: str):
-        """Plays on the music channel once; stops any existing music."""
-        if not self.enabled or not self._mixer_ok or not self._file_exists(path):
-            return
+    def _is_playing(self) -> bool:
         try:
-            self._pygame.mixer.music.stop()
-            self._pygame.mixer.music.load(path)
-            self._pygame.mixer.music.play()
+            if self._current is not None:
+                return self._current.get_num_channels() > 0
+            return bool(self._pygame.mixer.music.get_busy())
         except Exception:
-            pass
+            return False
 
-    def play_music_loop(self, path: str):
-        """Plays on the music channel looping; stops any existing music."""
+    def _play_music(self, path: str, loops: int):
         if not self.enabled or not self._mixer_ok or not self._file_exists(path):
             return
+        # Re-triggering the cue that is already playing (double-clicked Intro,
+        # same rating twice in a row) would only restart it from the top.
+        if path == self._current_path and self._is_playing():
+            return
+        self.stop_music()
         try:
-            self._pygame.mixer.music.stop()
-            self._pygame.mixer.music.load(path)
-            self._pygame.mixer.music.play(-1)
+            snd = self._sounds.get(path)
+            if snd is not None:
+                snd.play(loops=loops)
+                self._current = snd
+            else:
+                self._music_loader.submit(self._load_and_play_music, path, loops, self._music_gen)
+            self._current_path = path
         except Exception:
             pass
 
+    def play_music_once(self, path: str):
+        """Plays on the music channel once; stops any existing music."""
+        self._play_music(path, 0)
+
+    def play_music_loop(self, path: str):
+        """Plays on the music channel looping; stops any existing music."""
+        self._play_music(path, -1)
+
     def play_timeup(self, path: str):
         """Attempts to play as a Sound (can overlap music). Falls back silently."""
         if not self.enabled or not self._mixer_ok or not self._file_exists(path):
             return
         try:
-            snd = self._pygame.mixer.Sound(path)
-            snd.play()
+            self._get_sound(path).play()
         except Exception:
+            # Stream it instead; stop_music supersedes any queued load first.
+            self.stop_music()
             try:
-                self._pygame.mixer.music.stop()
-                self._pygame.mixer.music.load(path)
-                self._pygame.mixer.music.play()
+                self._music_loader.submit(self._load_and_play_music, path, 0, self._music_gen)
             except Exception:
                 pass
 
@@ -132,36 +234,114 @@ class SoundManager:
 # Data loading
 # -------------------------
 
-def load_students_by_class(path: str) -> dict[str, list[str]]:
+_CACHE_VERSION = 5
+
+
+def _cache_path(path: str) -> str | None:
+    """
+    Per-user cache file for path, or None when caching would not pay off.
+    Files unpacked into a PyInstaller --onefile bundle live in a temp
+    directory that is recreated on every launch, so they are never cached.
+    """
+    abs_path = os.path.abspath(path)
+    bundle = getattr(sys, "_MEIPASS", None)
+    if bundle and abs_path.startswith(os.path.join(os.path.abspath(bundle), "")):
+        return None
+
+    base = os.environ.get("LOCALAPPDATA") if os.name == "nt" else os.environ.get("XDG_CACHE_HOME")
+    base = base or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.sha1(abs_path.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(base, "studentselector", f"{os.path.basename(path)}.{digest}.pkl")
+
+
+def cached_load(path: str, parse_fn):
+    """
+    Returns parse_fn(path), reusing a pickle in the per-user cache directory
+    while the file's (path, mtime, size) is unchanged. Cache errors degrade
+    to a parse.
+    """
+    cache_path = _cache_path(path)
+    if cache_path is None:
+        return parse_fn(path)
+    try:
+        st = os.stat(path)
+    except OSError:
+        return parse_fn(path)
+
+    key = (
+        _CACHE_VERSION,
+        getattr(parse_fn, "__name__", ""),
+        os.path.abspath(path),
+        st.st_mtime_ns,
+        st.st_size,
+    )
+
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, data = pickle.load(f)
+        if cached_key == key:
+            return data
+    except Exception:
+        pass
+
+    data = parse_fn(path)
+    # Write to a temp file and swap it in, so a crash or a second instance
+    # never leaves a truncated cache behind.
+    tmp_path = None
+    try:
+        cache_dir = os.path.dirname(cache_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except Exception:
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+    return data
+
+
+def _is_roster_header(row: list[str]) -> bool:
+    header = ",".join(row).strip().lower()
+    return "class" in header and ("student" in header or "name" in header)
+
+
+def load_students_by_class(path: str) -> dict[str, tuple[str, ...]]:
     """
     Accepts a CSV with 2 columns: class_name, student_name.
     - If there is a header, it will be skipped automatically when detected.
-    - UTF-8 is assumed.
+    - UTF-8 is assumed; a leading BOM (Excel "CSV UTF-8") is dropped.
+    Rosters are returned as tuples; session state keeps its own mutable lists.
     """
     classes: dict[str, list[str]] = {}
     if not os.path.isfile(path):
         raise FileNotFoundError(f"Missing roster file: {path}")
 
-    with open(path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.reader(f)
-        first = True
-        for row in reader:
-            if not row or len(row) < 2:
-                continue
-            if first:
-                first = False
-                header = ",".join(row).strip().lower()
-                if "class" in header and ("student" in header or "name" in header):
-                    continue
-            class_name = row[0].strip()
-            student_name = row[1].strip()
-            if not class_name or not student_name:
-                continue
-            classes.setdefault(class_name, []).append(student_name)
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        rows = [row for row in csv.reader(f, skipinitialspace=True) if len(row) >= 2]
+
+    # Header detection only ever applies to the first usable row, so check it
+    # once up front instead of branching on every row of the roster.
+    if rows and _is_roster_header(rows[0]):
+        del rows[0]
 
-    for k in classes:
-        classes[k] = list(dict.fromkeys(classes[k]))  # de-dup preserving order
-    return classes
+    seen: dict[str, set[str]] = {}
+    for row in rows:
+        class_name = row[0].strip()
+        student_name = row[1].strip()
+        if not class_name or not student_name:
+            continue
+        # de-dup preserving order while parsing
+        class_seen = seen.setdefault(class_name, set())
+        if student_name in class_seen:
+            continue
+        class_seen.add(student_name)
+        classes.setdefault(class_name, []).append(student_name)
+
+    return {k: tuple(v) for k, v in classes.items()}
 
 
 def load_messages_by_rating(path: str) -> dict[str, list[str]]:
@@ -172,11 +352,24 @@ def load_messages_by_rating(path: str) -> dict[str, list[str]]:
     if not os.path.isfile(path):
         raise FileNotFoundError(f"Missing messages file: {path}")
 
-    with open(path, "r", encoding="utf-8", newline="") as f:
-        reader = csv.DictReader(f)
+    with open(path, "r", encoding="utf-8-sig", newline="") as f:
+        # Hand-edited files often pad after commas ('A*, "Well done, Sam"'),
+        # which would otherwise break quoting and leave spaces in the header.
+        reader = csv.reader(f, skipinitialspace=True)
+        header = [name.strip() for name in next(reader, None) or ()]
+        # Resolve the columns once; DictReader would build a dict per row.
+        try:
+            rating_idx = header.index("Rating")
+            msg_idx = header.index("Message")
+        except ValueError:
+            return messages
+        min_len = max(rating_idx, msg_idx) + 1
+
         for row in reader:
-            rating = (row.get("Rating") or "").strip()
-            msg = (row.get("Message") or "").strip()
+            if len(row) < min_len:
+                continue
+            rating = row[rating_idx].strip()
+            msg = row[msg_idx].strip()
             if not rating or not msg:
                 continue
             messages.setdefault(rating, []).append(msg)